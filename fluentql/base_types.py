@@ -24,18 +24,62 @@ Constant = TypeVar(
 T = TypeVar("T")
 
 
+def _find_dtype(cls):
+    """
+    Find the type argument of the Collection[...] base a class derives from.
+
+    Args:
+        cls (type):
+
+    Returns:
+        type|None
+    """
+    for klass in cls.__mro__:
+        for base in klass.__dict__.get("__orig_bases__", ()):
+            if getattr(base, "__origin__", None) is Collection:
+                return base.__args__[0]
+
+    return None
+
+
+class _DTypeFallback:
+    """
+    Resolves __dtype__ on first access for classes that __init_subclass__
+    could not handle. On Python 3.6, typing sets __orig_bases__ only after
+    the class is created, so it is not available to __init_subclass__ yet.
+    """
+
+    def __get__(self, instance, owner):
+        dtype = _find_dtype(owner)
+
+        if dtype is None:
+            raise AttributeError("__dtype__")
+
+        return dtype
+
+
 class Collection(Generic[T]):
+    __slots__ = ()
+
+    __dtype__ = _DTypeFallback()
+
     def __init_subclass__(cls, *args, **kwargs):
         """
         Hook into subclasses and set the __dtype__ attribute.
 
-        This is a pretty dumb implementation at the moment so it should
-        be revisited as it makes too many assumptions about the way
-        subclasses are constructed, assumptions which are NOT made in
-        type_checking
+        Only classes that parameterise Collection directly (e.g.
+        Collection[NumberType]) carry it in their own __orig_bases__; any
+        other subclass inherits __dtype__ from its parent, so the lookup is
+        skipped for them. Where __orig_bases__ is not set yet (Python 3.6),
+        the _DTypeFallback descriptor resolves it on access instead.
         """
-        cls.__dtype__ = cls.__orig_bases__[0].__args__[0]
+        super().__init_subclass__(*args, **kwargs)
+
+        for base in cls.__dict__.get("__orig_bases__", ()):
+            if getattr(base, "__origin__", None) is Collection:
+                cls.__dtype__ = base.__args__[0]
+                break
 
 
 class Referenceable:
-    pass
+    __slots__ = ()
@@ -3,12 +3,43 @@ from ..query import Query
 from ..types import Column, Table
 
 
+def _build_lookup(namespace):
+    """
+    Build a dict of all the public attributes of a namespace class, such as
+    the keywords or operators of a dialect.
+
+    Args:
+        namespace (type|None):
+
+    Returns:
+        dict
+    """
+    if namespace is None:
+        return {}
+
+    return {
+        name: getattr(namespace, name)
+        for name in dir(namespace)
+        if not name.startswith("_")
+    }
+
+
 class BaseDialect:
     _names = None
     _keywords = None
     _operators = None
     _symbols = None
     _options = {}
+    _dispatch_table = {}
+    _prepared_dispatch_table = {}
+    _command_table = {}
+    _name_map = {}
+    _keyword_map = {}
+    _operator_map = {}
+    _symbol_map = {}
+
+    # Collects constant values while compiling a prepared query
+    _parameters = None
 
     def __init__(self, **options):
         """
@@ -17,49 +48,148 @@ class BaseDialect:
         """
         self._options = {**self._options, **options}
 
+        self._user_options = options
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Give each dialect class its own dispatch tables, so that methods
+        resolved for a parent dialect are never reused for a subclass that
+        overrides them.
+
+        Args:
+            cls (type):
+            **kwargs (dict):
+        """
+        super().__init_subclass__(**kwargs)
+
+        cls._dispatch_table = {}
+        cls._prepared_dispatch_table = {}
+        cls._command_table = {}
+
+        # Resolve the dialect vocabulary once per class, as dialects are
+        # instantiated for every compiled query
+        cls._name_map = _build_lookup(cls._names)
+        cls._keyword_map = _build_lookup(cls._keywords)
+        cls._operator_map = _build_lookup(cls._operators)
+        cls._symbol_map = _build_lookup(cls._symbols)
+
     def dispatch(self, o):
         """
         Dispatch to appropriate function.
 
+        The compile method is resolved once per concrete type of o and cached
+        in the class dispatch table, so repeated nodes of the same type cost a
+        single dict lookup. While parameters are collected, a separate table
+        is used, which maps constants to placeholders.
+
         Args:
             o (object):
 
         Returns:
             str
         """
-        method_name = None
+        node_type = type(o)
+        method = self._dispatch_table.get(node_type)
+
+        if method is None:
+            method = self._resolve_dispatch(node_type, self._parameters is not None)
+            self._dispatch_table[node_type] = method
+
+        return method(self, o)
+
+    @classmethod
+    def _get_handler(cls, node_type):
+        """
+        Get the compile method dispatch would use for a given node type.
+
+        Args:
+            node_type (type):
+
+        Returns:
+            function
+        """
+        method = cls._dispatch_table.get(node_type)
+
+        if method is None:
+            method = cls._resolve_dispatch(node_type)
+            cls._dispatch_table[node_type] = method
+
+        return method
+
+    @classmethod
+    def _resolve_dispatch(cls, node_type, parameters=False):
+        """
+        Find the compile method for a given node type.
+
+        Args:
+            node_type (type):
+            parameters (bool): If True, constants of any type are added as
+                parameters. Defaults to False
+
+        Returns:
+            function
+        """
+        if issubclass(node_type, Query):
+            # The compile method depends on the query command, not on its type
+            return cls._dispatch_query
+
+        if issubclass(node_type, F):
+            # First look for specific function implementations, then fall
+            # back to generic
+            f_name = node_type.__name__.lower()
+            method = getattr(cls, f"compile_{f_name}_function", None)
+
+            return method or cls.compile_function
 
-        if isinstance(o, Query):
-            command = o._command.value.lower()
-            method_name = f"compile_{command}_query"
+        if issubclass(node_type, Column):
+            return cls.compile_column_reference
 
-        elif isinstance(o, F):
-            # First look for specific function implementations
-            f_name = type(o).__name__.lower()
-            method_name = f"compile_{f_name}_function"
+        if issubclass(node_type, Table):
+            return cls.compile_table_reference
 
-            # If that method doesn't exist, fall back to generic
-            if not hasattr(self, method_name):
-                method_name = f"compile_function"
+        # Assume constant
+        if parameters:
+            return cls._add_parameter
 
-        elif isinstance(o, Column):
-            method_name = f"compile_column_reference"
+        # First look for specific implementations, then fall back to generic
+        type_name = node_type.__name__.lower()
+        method = getattr(cls, f"compile_{type_name}_constant", None)
 
-        elif isinstance(o, Table):
-            method_name = f"compile_table_reference"
+        return method or cls.compile_constant
+
+    def _add_parameter(self, val):
+        """
+        Records a constant value and returns its placeholder.
+
+        Args:
+            val (object):
 
-        else:
-            # Assume constant
-            type_name = type(o).__name__.lower()
+        Returns:
+            str
+        """
+        self._parameters.append(val)
 
-            # First look for specific function implementations
-            method_name = f"compile_{type_name}_constant"
+        return self._get_symbol("PARAMETER")
 
-            if not hasattr(self, method_name):
-                # Fall back to generic
-                method_name = f"compile_constant"
+    def _dispatch_query(self, query):
+        """
+        Dispatch a query to the compile method for its command. Methods are
+        resolved once per command and cached in the class command table.
 
-        return getattr(self, method_name)(o)
+        Args:
+            query (Query):
+
+        Returns:
+            str
+        """
+        command = query._command
+        method = self._command_table.get(command)
+
+        if method is None:
+            method = getattr(type(self), f"compile_{command.value.lower()}_query")
+            self._command_table[command] = method
+
+        return method(self, query)
 
     def compile(self, query):
         """
@@ -73,6 +203,35 @@ class BaseDialect:
         """
         return self.dispatch(query)
 
+    def compile_many(self, queries):
+        """
+        Compile a sequence of queries, as Query.compile would with this
+        dialect's class and options, reusing one dialect per distinct set of
+        options instead of building a dialect per query.
+
+        Args:
+            queries (iterable(Query)):
+
+        Returns:
+            list(str)
+        """
+        dialects = {}
+        compiled = []
+
+        for query in queries:
+            # Options derived from each query (e.g. absolute column names for
+            # joins) apply unless this dialect was given them explicitly
+            options = query._dialect_options(getattr(self, "_user_options", {}))
+            key = tuple(options.items())
+            dialect = dialects.get(key)
+
+            if dialect is None:
+                dialect = dialects[key] = type(self)(**options)
+
+            compiled.append(dialect.compile(query))
+
+        return compiled
+
     def _get_option(self, name):
         """
         Get a dialect option by name.
@@ -107,7 +266,7 @@ class BaseDialect:
         Returns:
             str
         """
-        return getattr(self._keywords, name)
+        return self._keyword_map[name]
 
     def _get_name(self, name):
         """
@@ -117,7 +276,7 @@ class BaseDialect:
         Returns:
             str
         """
-        return getattr(self._names, name)
+        return self._name_map[name]
 
     def _get_symbol(self, name):
         """
@@ -127,7 +286,7 @@ class BaseDialect:
         Returns:
             str
         """
-        return getattr(self._symbols, name)
+        return self._symbol_map[name]
 
     def _get_operator(self, name):
         """
@@ -137,4 +296,4 @@ class BaseDialect:
         Returns:
             str
         """
-        return getattr(self._operators, name)
+        return self._operator_map[name]
@@ -1,8 +1,13 @@
+from copy import copy
+
 from .base import BaseDialect
-from ..function import F, Star
+from ..function import BitwiseAnd, BitwiseOr, BitwiseXor, F
 from ..errors import CompilationError
 
 
+_CHAIN_OPERATORS = {BitwiseAnd: "AND", BitwiseOr: "OR", BitwiseXor: "XOR"}
+
+
 class _GenericNames:
     MAX = "max"
     MIN = "min"
@@ -62,6 +67,7 @@ class _GenericOperators:
 
 class _GenericSymbols:
     LIST_SEPARATOR = ","
+    PARAMETER = "?"
     QUERY_END = ";"
     STRING_QUOTE = "'"
 
@@ -77,6 +83,19 @@ class GenericSQLDialect(BaseDialect):
         "keywords_caps": True,
         "break_line_on_sections": True,
         "indent": False,
+        "use_absolute_names_for_columns": False,
+    }
+
+    # Keyword names for boolean constants
+    _bool_keywords = {True: "TRUE", False: "FALSE"}
+
+    # Keyword names for each join type
+    _join_keywords = {
+        "inner": "INNER_JOIN",
+        "outer": "OUTER_JOIN",
+        "left": "LEFT_JOIN",
+        "right": "RIGHT_JOIN",
+        "cross": "CROSS_JOIN",
     }
 
     def __init__(self, **options):
@@ -86,8 +105,17 @@ class GenericSQLDialect(BaseDialect):
         - keywords_caps: bool
         - break_line_on_sections: bool
         - indent: bool
+        - use_absolute_names_for_columns: bool
         """
-        self._options = {**self._options, **options}
+        super().__init__(**options)
+
+        # Resolved once, as they are read for every column reference, string
+        # constant and list
+        self._absolute_column_names = self._get_option(
+            "use_absolute_names_for_columns"
+        )
+        self._string_quote = self._get_symbol("STRING_QUOTE")
+        self._list_separator = f"{self._get_symbol('LIST_SEPARATOR')} "
 
     def compile(self, query):
         """
@@ -105,6 +133,30 @@ class GenericSQLDialect(BaseDialect):
 
         return f"{compiled_query}{query_end_symbol}"
 
+    def compile_prepared(self, query):
+        """
+        Compiles a query with every constant replaced by a placeholder.
+        The values are returned separately, in the order of their
+        placeholders, so they can be passed to a DB-API cursor.
+
+        Like compile, this uses the options of this dialect as they are; use
+        Query.compile_prepared to also apply the options derived from the
+        query, such as absolute column names for joins.
+
+        Args:
+            query (Query):
+
+        Returns:
+            tuple: (str, list)
+        """
+        # Collect the values on a copy, so this instance never changes and
+        # can keep compiling other queries, e.g. from another thread
+        prepared = copy(self)
+        prepared._parameters = []
+        prepared._dispatch_table = self._prepared_dispatch_table
+
+        return prepared.compile(query), prepared._parameters
+
     def compile_select_query(self, query):
         """
         Compile a select query.
@@ -119,82 +171,64 @@ class GenericSQLDialect(BaseDialect):
         if query._target is None or len(query._target) == 0:
             raise CompilationError("Select query must have a target")
 
-        q_template_components = ["{select}", "{targets}", "{from_}"]
+        # Bound once, as it is called for every section and list element
+        dispatch = self.dispatch
 
-        query_components = {}
-
-        select_keyword = self._get_keyword("SELECT")
+        parts = [self._get_keyword("SELECT")]
 
         if query.has_option("distinct"):
-            distinct_keyword = self._get_keyword("DISTINCT")
-            query_components["select"] = f"{select_keyword} {distinct_keyword}"
-        else:
-            query_components["select"] = select_keyword
+            parts.append(self._get_keyword("DISTINCT"))
 
-        if type(query._select) is Star:
-            query_components["targets"] = self.dispatch(query._select)
-        else:
-            query_components["targets"] = ", ".join(
-                self.dispatch(t) for t in query._select
-            )
-
-        query_components[
-            "from_"
-        ] = f"{self._get_keyword('FROM')} {self.dispatch(query._target[0])}"
+        parts.append(self._compile_list(query._select))
 
-        # Compile join if it exists
-        if query._join is not None:
-            joins = [self.dispatch(join) for join in query._join]
-            query_components["joins"] = " ".join(joins)
+        parts.append(self._get_keyword("FROM"))
+        parts.append(dispatch(query._target[0]))
 
-        if query._join is not None:
-            q_template_components.append("{joins}")
-            joins = [self.dispatch(join) for join in query._join]
-            query_components["joins"] = " ".join(joins)
+        if query._join:
+            parts.extend([dispatch(join) for join in query._join])
 
         if query._where is not None:
-            q_template_components.append("{where_keyword}")
-            q_template_components.append("{where}")
-            query_components["where_keyword"] = self._get_keyword("WHERE")
-            query_components["where"] = self.dispatch(query._where)
-
-        if query._group_by is not None:
-            q_template_components.append("{group_by_keyword}")
-            q_template_components.append("{group_by}")
-            query_components["group_by_keyword"] = self._get_keyword("GROUP_BY")
-            query_components["group_by"] = ", ".join(
-                [self.dispatch(c) for c in query._group_by]
-            )
+            parts.append(self._get_keyword("WHERE"))
+            parts.append(dispatch(query._where))
+
+        if query._group_by:
+            parts.append(self._get_keyword("GROUP_BY"))
+            parts.append(self._compile_list(query._group_by))
 
         if query._having is not None:
-            q_template_components.append("{having_keyword}")
-            q_template_components.append("{having}")
-            query_components["having_keyword"] = self._get_keyword("HAVING")
-            query_components["having"] = self.dispatch(query._having)
-
-        if query._order is not None:
-            q_template_components.append("{order_by_keyword}")
-            q_template_components.append("{order_by}")
-            query_components["order_by_keyword"] = self._get_keyword("ORDER_BY")
-            query_components["order_by"] = ", ".join(
-                [self.dispatch(c) for c in query._order]
-            )
+            parts.append(self._get_keyword("HAVING"))
+            parts.append(dispatch(query._having))
+
+        if query._order:
+            parts.append(self._get_keyword("ORDER_BY"))
+            parts.append(self._compile_list(query._order))
 
         if query.has_option("fetch"):
-            q_template_components.append("{fetch_keyword}")
-            q_template_components.append("{fetch}")
-            query_components["fetch_keyword"] = self._get_keyword("FETCH")
-            query_components["fetch"] = self.dispatch(query.get_option("fetch"))
+            parts.append(self._get_keyword("FETCH"))
+            parts.append(dispatch(query.get_option("fetch")))
 
         if query.has_option("skip"):
-            q_template_components.append("{skip_keyword}")
-            q_template_components.append("{skip}")
-            query_components["skip_keyword"] = self._get_keyword("SKIP")
-            query_components["skip"] = self.dispatch(query.get_option("skip"))
+            parts.append(self._get_keyword("SKIP"))
+            parts.append(dispatch(query.get_option("skip")))
 
-        query_template = " ".join(q_template_components)
+        return " ".join(parts)
+
+    def _compile_list(self, items):
+        """
+        Compiles a sequence of items as a comma separated list.
+
+        Args:
+            items (list):
+
+        Returns:
+            str
+        """
+        # Single item lists are the common case (one target, one order by
+        # column, one function argument), so skip building the list
+        if len(items) == 1:
+            return self.dispatch(items[0])
 
-        return query_template.format(**query_components)
+        return self._list_separator.join(map(self.dispatch, items))
 
     def compile_delete_query(self, query):
         """
@@ -210,29 +244,25 @@ class GenericSQLDialect(BaseDialect):
         if query._target is None or len(query._target) == 0:
             raise CompilationError("Delete query must have a target")
 
-        q_template_components = ["{delete}", "{from_}"]
-
-        query_components = {}
-
-        query_components["delete"] = self._get_keyword("DELETE")
-        query_components[
-            "from_"
-        ] = f"{self._get_keyword('FROM')} {self.dispatch(query._target[0])}"
+        parts = [
+            self._get_keyword("DELETE"),
+            self._get_keyword("FROM"),
+            self.dispatch(query._target[0]),
+        ]
 
         if query._where is not None:
-            q_template_components.append("{where_keyword}")
-            q_template_components.append("{where}")
-            query_components["where_keyword"] = self._get_keyword("WHERE")
-            query_components["where"] = self.dispatch(query._where)
-
-        query_template = " ".join(q_template_components)
+            parts.append(self._get_keyword("WHERE"))
+            parts.append(self.dispatch(query._where))
 
-        return query_template.format(**query_components)
+        return " ".join(parts)
 
     def compile_infix_function(self, f, name=None):
         """
         Compiles a function with 2 arguments as: dispatch(values[0]) NAME
         dispatch(values[1]). If name is not given, the function name is used.
+        Left operands that are boolean connectives (and, or, xor) are
+        compiled without going back through dispatch, unless this dialect
+        overrides their handlers, this method or dispatch.
 
         Args:
             f (F):
@@ -241,21 +271,69 @@ class GenericSQLDialect(BaseDialect):
         Returns:
             str
         """
+        if name is None:
+            name = type(f).__name__.lower()
+
+        # Conditions added through where, or_where, on etc. nest to the left,
+        # e.g. ((a and b) or c). Walk down the connectives on the left
+        # iteratively, so that long chains do not exceed the recursion limit.
+        # The left operand is never wrapped in parentheses, so this compiles
+        # to the same string as dispatching each node in turn.
+        chain_operators = type(self)._get_chain_operators()
         left, right = f.__values__
+        right_operands = [(name, right)]
 
-        left_c = self.dispatch(left)
+        while type(left) in chain_operators:
+            operator = self._get_operator(chain_operators[type(left)])
+            left, right = left.__values__
+            right_operands.append((operator, right))
 
-        if name is None:
-            name = type(f).__name__.lower()
+        dispatch = self.dispatch
+        parts = [dispatch(left)]
+
+        for name, right in reversed(right_operands):
+            right_c = dispatch(right)
+
+            # If rhs is a function and one of its args is a function,
+            # wrap it in parantheses
+            if isinstance(right, F) and right.__nested__:
+                right_c = f"({right_c})"
+
+            parts.append(name)
+            parts.append(right_c)
 
-        right_c = self.dispatch(right)
+        return " ".join(parts)
 
-        # If rhs is a function and one of its args is a function,
-        # wrap it in parantheses
-        if isinstance(right, F) and any(isinstance(v, F) for v in right.__values__):
-            right_c = f"({right_c})"
+    @classmethod
+    def _get_chain_operators(cls):
+        """
+        Maps the boolean connectives that compile_infix_function may walk
+        iteratively to their operator keys, for this dialect class. The map
+        is empty if the class overrides compile_infix_function or dispatch,
+        and leaves out connectives with an overridden handler.
+
+        Returns:
+            dict
+        """
+        operators = cls.__dict__.get("_chain_operators")
 
-        return f"{left_c} {name} {right_c}"
+        if operators is None:
+            operators = {}
+
+            if (
+                cls.compile_infix_function
+                is GenericSQLDialect.compile_infix_function
+                and cls.dispatch is BaseDialect.dispatch
+            ):
+                for f_type, operator in _CHAIN_OPERATORS.items():
+                    stock_handler = GenericSQLDialect._get_handler(f_type)
+
+                    if cls._get_handler(f_type) is stock_handler:
+                        operators[f_type] = operator
+
+            cls._chain_operators = operators
+
+        return operators
 
     def compile_join_query(self, join):
         """
@@ -267,35 +345,33 @@ class GenericSQLDialect(BaseDialect):
         Returns:
             str
         """
-        join_target = self.dispatch(join._target[-1])
         join_type = join.get_option("join_type")
 
-        if join_type == "inner":
-            join_type_str = self._get_keyword("INNER_JOIN")
-        elif join_type == "outer":
-            join_type_str = self._get_keyword("OUTER_JOIN")
-        elif join_type == "left":
-            join_type_str = self._get_keyword("LEFT_JOIN")
-        elif join_type == "right":
-            join_type_str = self._get_keyword("RIGHT_JOIN")
-        elif join_type == "cross":
-            join_type_str = self._get_keyword("CROSS_JOIN")
-        else:
+        try:
+            join_keyword = self._join_keywords[join_type]
+        except KeyError:
             raise CompilationError(f"Join type invalid: {join_type}")
 
-        compiled_join = f"{join_type_str} {join_target}"
-
         if join._on is not None and join._using is not None:
             raise CompilationError("Cannot have both USING and ON in a JOIN")
 
+        parts = [self._get_keyword(join_keyword), self.dispatch(join._target[-1])]
+
         if join._on is not None:
-            compiled_on = self.dispatch(join._on)
-            compiled_join = f"{compiled_join} {self._get_keyword('ON')} {compiled_on}"
+            parts.append(self._get_keyword("ON"))
+            parts.append(self.dispatch(join._on))
         elif join._using is not None:
-            using = f"using ({self.dispatch(join._using)})"
-            compiled_join = f"{compiled_join} {using}"
+            # The using column is an identifier, never a quoted constant or a
+            # placeholder
+            using = join._using
+
+            if not isinstance(using, str):
+                using = self.dispatch(using)
 
-        return compiled_join
+            parts.append(self._get_keyword("USING"))
+            parts.append(f"({using})")
+
+        return " ".join(parts)
 
     def compile_constant(self, val):
         """
@@ -311,7 +387,7 @@ class GenericSQLDialect(BaseDialect):
 
     def compile_str_constant(self, val):
         """
-        Wraps a string in quotes.
+        Wraps a string in quotes, doubling any quotes inside it.
 
         Args:
             val (str):
@@ -319,7 +395,9 @@ class GenericSQLDialect(BaseDialect):
         Returns:
             str
         """
-        quote_char = self._get_symbol("STRING_QUOTE")
+        quote_char = self._string_quote
+        val = val.replace(quote_char, quote_char * 2)
+
         return f"{quote_char}{val}{quote_char}"
 
     def compile_bool_constant(self, val):
@@ -332,10 +410,7 @@ class GenericSQLDialect(BaseDialect):
         Returns:
             str
         """
-        if val is True:
-            return self._get_keyword("TRUE")
-
-        return self._get_keyword("FALSE")
+        return self._get_keyword(self._bool_keywords[val])
 
     def compile_nonetype_constant(self, val):
         """
@@ -362,7 +437,7 @@ class GenericSQLDialect(BaseDialect):
         name = name or type(f).__name__.lower()
         values = f.__values__
 
-        compiled_values = f", ".join([self.dispatch(v) for v in values])
+        compiled_values = self._compile_list(values)
 
         return f"{name}({compiled_values})"
 
@@ -580,7 +655,14 @@ class GenericSQLDialect(BaseDialect):
 
         left = self.dispatch(values[0])
         name = self._get_operator("IN")
-        right = self.dispatch(values[1])
+
+        if self._parameters is not None and isinstance(
+            values[1], (list, tuple, set, frozenset)
+        ):
+            # One placeholder per value, as drivers bind a single value each
+            right = self._list_separator.join(map(self._add_parameter, values[1]))
+        else:
+            right = self.dispatch(values[1])
 
         return f"{left} {name} ({right})"
 
@@ -660,12 +742,7 @@ class GenericSQLDialect(BaseDialect):
         Returns:
             str
         """
-        option_name = "use_absolute_names_for_columns"
-        absolute_name = (
-            self._get_option(option_name) if self._has_option(option_name) else False
-        )
-
-        if absolute_name:
+        if self._absolute_column_names:
             return f"{column.table.name}.{column.name}"
 
         return column.name
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, TypeVar, Union
 from types import MethodType, FunctionType
 
@@ -10,12 +11,44 @@ NoArgs = TypeVar("NoArgs")
 VarArgs = TypeVar("VarArgs")
 T = TypeVar("T")
 
+# Argument annotations shared by the built-in functions
+ConstantArg = Union[Constant, Collection[Constant]]
+AnyConstantArg = Union[Constant, Collection[Any]]
+BooleanArg = Union[Collection[BooleanType], BooleanType]
+
+# Validated type checkers, keyed by (expected, given) argument types. A
+# TypeChecker only depends on those, so functions called with the same
+# argument types share one instead of matching the types again.
+_type_checkers = {}
+
+
+@lru_cache(maxsize=None)
+def _has_collection(types):
+    """
+    Checks whether any of the given types is a Collection subclass. Cached,
+    as return types are resolved from the same few combinations of types for
+    every function instance.
+
+    Args:
+        types (tuple(type)):
+
+    Returns:
+        bool
+    """
+    return any(Collection in t.__mro__ for t in types if hasattr(t, "__mro__"))
+
 
 class WithOperatorSupport:
     """
     Implements operator support.
     """
 
+    __slots__ = ()
+
+    # __eq__ builds an Equals function, which would otherwise make columns
+    # and functions unhashable. Hash by identity so they can be dict keys.
+    __hash__ = object.__hash__
+
     def __gt__(self, other):
         return GreaterThan(self, other)
 
@@ -87,6 +120,8 @@ class WithOperatorSupport:
 
 
 class F(Referenceable):
+    __slots__ = ("__values__", "__nested__", "__returns__", "__type_checker__")
+
     def __init_subclass__(cls, **kwargs):
         """
         Use init_subclass to map the arguments / return value based on type
@@ -101,52 +136,80 @@ class F(Referenceable):
     @classmethod
     def _process_annotations(cls):
         """
-        Set __args__ and __returns__ attributes to cls. Those will be set to
-        the user annotations, if any, or will default to:
+        Set __args__, __declared_returns__ and __returns_callable__
+        attributes to cls. The first two will be set to the user annotations,
+        if any, or will default to:
 
         AnyArgs - for __args__
-        Any - for __returns__
+        Any - for __declared_returns__
+
+        The declared return type is kept apart from the __returns__ slot, which
+        holds the return type resolved for each instance.
+
+        Subclasses without annotations of their own keep the __args__ of their
+        parent; if they do not override returns either, nothing is recomputed.
 
         Args:
             cls (object):
         """
-        try:
-            annotations = {**cls.__annotations__}
-        except AttributeError:
-            annotations = {}
+        own_annotations = cls.__dict__.get("__annotations__")
+        inherits_args = not own_annotations and hasattr(cls, "__args__")
+
+        if inherits_args and "returns" not in cls.__dict__:
+            return
+
+        annotations = own_annotations or {}
 
         # Check for "returns"
         if "returns" in annotations:
-            cls.__returns__ = annotations.pop("returns")
+            cls.__declared_returns__ = annotations["returns"]
         elif hasattr(cls, "returns"):
-            cls.__returns__ = cls.returns
+            cls.__declared_returns__ = cls.returns
         else:
-            cls.__returns__ = Any
+            cls.__declared_returns__ = Any
+
+        # Resolved once per class rather than for every instance
+        cls.__returns_callable__ = isinstance(
+            cls.__declared_returns__, (FunctionType, MethodType)
+        )
+
+        if inherits_args:
+            return
+
+        # Read the argument types straight from the annotations, skipping
+        # "returns", rather than copying the dict to pop it
+        arg_types = tuple(t for name, t in annotations.items() if name != "returns")
 
-        if len(annotations) == 0:
+        if len(arg_types) == 0:
             cls.__args__ = AnyArgs
-        elif len(annotations) == 1 and list(annotations.values())[0] is NoArgs:
+        elif len(arg_types) == 1 and arg_types[0] is NoArgs:
             cls.__args__ = NoArgs
         else:
-            cls.__args__ = tuple(annotations.values())
+            cls.__args__ = arg_types
 
     def __init__(self, *args):
         self._validate_args(args)
         self.__values__ = args
 
+        # Whether any argument is itself a function; dialects use it to decide
+        # when an operand needs parentheses
+        self.__nested__ = any(isinstance(arg, F) for arg in args)
+
         self.__returns__ = self._get_return_type()
 
     def _get_return_type(self):
-        # If __returns__ is a function, the result of it called
+        returns = self.__declared_returns__
+
+        # If the declared return type is a function, the result of it called
         # on args is the actual return type
-        if isinstance(self.__returns__, (FunctionType, MethodType)):
+        if self.__returns_callable__:
             # Replace F arg types with their return values
-            return self.__returns__(
+            return returns(
                 tuple(self.__type_checker__._matched_types),
                 self.__type_checker__._type_var_mapping,
             )
 
-        return self.__returns__
+        return returns
 
     @property
     def values(self):
@@ -171,7 +234,7 @@ class F(Referenceable):
                 raise TypeError(f"{type(self).__name__} takes at least one argument")
 
             # All expected args are Any
-            arg_types = [Any] * len(args)
+            arg_types = (Any,) * len(args)
 
         elif self.__args__ is NoArgs:
             if len(args) > 0:
@@ -185,16 +248,27 @@ class F(Referenceable):
             )
         else:
             # Replace F arg types with their return values
-            arg_types = [
-                arg.__returns__ if issubclass(type(arg), F) else type(arg)
-                for arg in args
-            ]
+            arg_types = tuple(
+                [
+                    arg.__returns__ if isinstance(arg, F) else type(arg)
+                    for arg in args
+                ]
+            )
+
+        key = (self.__args__, arg_types)
+        type_checker = _type_checkers.get(key)
 
-        self.__type_checker__ = TypeChecker(arg_types, self.__args__)
-        self.__type_checker__.validate()
+        if type_checker is None:
+            type_checker = TypeChecker(arg_types, self.__args__)
+            type_checker.validate()
+            _type_checkers[key] = type_checker
+
+        self.__type_checker__ = type_checker
 
 
 class ArithmeticF(WithOperatorSupport, F):
+    __slots__ = ()
+
     @classmethod
     def returns(cls, matched_types, type_var_mapping):
         """
@@ -209,18 +283,20 @@ class ArithmeticF(WithOperatorSupport, F):
         """
         constant_type = type_var_mapping[Constant][1]
 
-        if any(Collection in t.__mro__ for t in matched_types if hasattr(t, "__mro__")):
+        if _has_collection(matched_types):
             return Collection[constant_type]
 
         return constant_type
 
 
 class BooleanF(F):
+    __slots__ = ()
+
     @classmethod
     def returns(cls, matched_types, type_var_mapping):
         """
-        If both args are BooleanType, the return value is BooleanType.
-        Otherwise, the return value is collection.
+        The return value is always a collection of BooleanType, whatever the
+        argument types.
 
         Args:
             args (list(type)): Argument types, in order
@@ -228,13 +304,12 @@ class BooleanF(F):
         Returns:
             type
         """
-        if any(Collection in t.__mro__ for t in matched_types if hasattr(t, "__mro__")):
-            return Collection[BooleanType]
-
         return Collection[BooleanType]
 
 
 class AggregateF(WithOperatorSupport, F):
+    __slots__ = ()
+
     @classmethod
     def returns(cls, matched_types, type_var_mapping):
         try:
@@ -244,132 +319,182 @@ class AggregateF(WithOperatorSupport, F):
 
 
 class ComparisonF(F):
-    pass
+    __slots__ = ()
 
 
 class OrderF(F):
-    pass
+    __slots__ = ()
 
 
 class Add(ArithmeticF):
-    a: Union[Constant, Collection[Constant]]
-    b: Union[Constant, Collection[Constant]]
+    __slots__ = ()
+
+    a: ConstantArg
+    b: ConstantArg
 
 
 class Subtract(ArithmeticF):
-    a: Union[Constant, Collection[Any]]
-    b: Union[Constant, Collection[Any]]
+    __slots__ = ()
+
+    a: AnyConstantArg
+    b: AnyConstantArg
 
 
 class Multiply(ArithmeticF):
-    a: Union[Constant, Collection[Any]]
-    b: Union[Constant, Collection[Any]]
+    __slots__ = ()
+
+    a: AnyConstantArg
+    b: AnyConstantArg
 
 
 class Divide(ArithmeticF):
-    a: Union[Constant, Collection[Any]]
-    b: Union[Constant, Collection[Any]]
+    __slots__ = ()
+
+    a: AnyConstantArg
+    b: AnyConstantArg
 
 
 class Modulo(ArithmeticF):
-    a: Union[Constant, Collection[Any]]
-    b: Union[Constant, Collection[Any]]
+    __slots__ = ()
+
+    a: AnyConstantArg
+    b: AnyConstantArg
 
 
 class BitwiseOr(BooleanF):
-    a: Union[Collection[BooleanType], BooleanType]
-    b: Union[Collection[BooleanType], BooleanType]
+    __slots__ = ()
+
+    a: BooleanArg
+    b: BooleanArg
 
 
 class BitwiseAnd(BooleanF):
-    a: Union[Collection[BooleanType], BooleanType]
-    b: Union[Collection[BooleanType], BooleanType]
+    __slots__ = ()
+
+    a: BooleanArg
+    b: BooleanArg
 
 
 class BitwiseXor(BooleanF):
-    a: Union[Collection[BooleanType], BooleanType]
-    b: Union[Collection[BooleanType], BooleanType]
+    __slots__ = ()
+
+    a: BooleanArg
+    b: BooleanArg
 
 
 class Equals(BooleanF):
-    a: Union[Constant, Collection[Constant]]
-    b: Union[Constant, Collection[Constant]]
+    __slots__ = ()
+
+    a: ConstantArg
+    b: ConstantArg
 
 
 class LessThan(BooleanF):
-    a: Union[Constant, Collection[Any]]
-    b: Union[Constant, Collection[Any]]
+    __slots__ = ()
+
+    a: AnyConstantArg
+    b: AnyConstantArg
 
 
 class LessThanOrEqual(BooleanF):
-    a: Union[Constant, Collection[Any]]
-    b: Union[Constant, Collection[Any]]
+    __slots__ = ()
+
+    a: AnyConstantArg
+    b: AnyConstantArg
 
 
 class GreaterThan(BooleanF):
-    a: Union[Constant, Collection[Any]]
-    b: Union[Constant, Collection[Any]]
+    __slots__ = ()
+
+    a: AnyConstantArg
+    b: AnyConstantArg
 
 
 class GreaterThanOrEqual(BooleanF):
-    a: Union[Constant, Collection[Any]]
-    b: Union[Constant, Collection[Any]]
+    __slots__ = ()
+
+    a: AnyConstantArg
+    b: AnyConstantArg
 
 
 class NotEqual(BooleanF):
-    a: Union[Constant, Collection[Any]]
-    b: Union[Constant, Collection[Any]]
+    __slots__ = ()
+
+    a: AnyConstantArg
+    b: AnyConstantArg
 
 
 class Not(BooleanF):
-    a: Union[BooleanType, Collection[BooleanType]]
+    __slots__ = ()
+
+    a: BooleanArg
 
 
 class As(F):
+    __slots__ = ()
+
     a: T
     b: str
     returns: T
 
 
 class TableStar(F):
+    __slots__ = ()
+
     a: Referenceable
     returns: Any
 
 
 class Star(F):
+    __slots__ = ()
+
     a: NoArgs
     returns: Any
 
 
 class Like(BooleanF):
+    __slots__ = ()
+
     a: Collection[StringType]
     b: str
 
 
 class In(BooleanF):
+    __slots__ = ()
+
     a: Collection[Any]
     b: Any
 
 
 class Max(AggregateF):
+    __slots__ = ()
+
     a: Collection[Constant]
 
 
 class Min(AggregateF):
+    __slots__ = ()
+
     a: Collection[Constant]
 
 
 class Sum(AggregateF):
+    __slots__ = ()
+
     a: Collection[Constant]
 
 
 class Asc(OrderF):
+    __slots__ = ()
+
     a: Collection[Any]
 
     returns: Collection[Any]
 
 
 class Desc(OrderF):
+    __slots__ = ()
+
     a: Collection[Any]
 
     returns: Collection[Any]
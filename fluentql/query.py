@@ -53,6 +53,26 @@ def for_query_commands(*commands):
 
 
 class Query:
+    __slots__ = (
+        "_command",
+        "_target",
+        "_create",
+        "_update",
+        "_delete",
+        "_drop",
+        "_select",
+        "_join",
+        "_on",
+        "_using",
+        "_where",
+        "_group_by",
+        "_having",
+        "_order",
+        "_union",
+        "_union_order",
+        "_options",
+    )
+
     def __init__(self, command):
         """
         Args:
@@ -92,16 +112,43 @@ class Query:
         Returns:
             str
         """
+        dialect = dialect_cls(**self._dialect_options(user_options))
+
+        return dialect.compile(self)
+
+    def compile_prepared(self, dialect_cls, **user_options):
+        """
+        Compiles the query using a given dialect type, with constants replaced
+        by placeholders. The dialect must implement compile_prepared.
+
+        Args:
+            dialect_cls (type): Implementation of BaseDialect
+            **user_options: Options to be passed to the dialect constructor
+
+        Returns:
+            tuple: (str, list)
+        """
+        dialect = dialect_cls(**self._dialect_options(user_options))
+
+        return dialect.compile_prepared(self)
+
+    def _dialect_options(self, user_options):
+        """
+        Options to build a dialect with for compiling this query.
+
+        Args:
+            user_options (dict): Options given by the user, which override
+                the defaults derived from the query
+
+        Returns:
+            dict
+        """
         # If we have more than one target, we should use absolute names for
         # column references
         options = {"use_absolute_names_for_columns": len(self._target) > 1}
 
         # User options should override the settings defined here
-        dialect_options = {**options, **user_options}
-
-        dialect = dialect_cls(**dialect_options)
-
-        return dialect.compile(self)
+        return {**options, **user_options}
 
     @classmethod
     def select(cls, *columns):
@@ -189,23 +236,7 @@ class Query:
         Returns:
             Query self
         """
-        if isinstance(condition, FunctionType):
-            where_subquery = self._sub_query(QueryCommands.WHERE)
-            # Inherit targets
-            where_subquery._target = list(self._target)
-
-            # Call user function, which may or may not return a Query
-            # but that doesn't matter as we expect the given query
-            # object to be mutated
-            condition(where_subquery)
-
-            condition = where_subquery._where
-
-        if self._where is None:
-            self._where = condition
-        else:
-            # Set last where clause's boolean
-            self._where = boolean(self._where, condition)
+        self._add_condition("_where", QueryCommands.WHERE, condition, boolean)
 
         return self
 
@@ -379,21 +410,7 @@ class Query:
         Returns:
             Query self
         """
-        if isinstance(condition, FunctionType):
-            on_subquery = self._sub_query(QueryCommands.ON)
-
-            # Inherit targets
-            on_subquery._target = list(self._target)
-
-            # Call the user function
-            condition(on_subquery)
-
-            condition = on_subquery._on
-
-        if self._on is None:
-            self._on = condition
-        else:
-            self._on = boolean(self._on, condition)
+        self._add_condition("_on", QueryCommands.ON, condition, boolean)
 
         return self
 
@@ -501,23 +518,7 @@ class Query:
         Returns:
             Query self
         """
-        if isinstance(condition, FunctionType):
-            having_subquery = self._sub_query(QueryCommands.HAVING)
-            # Inherit targets
-            having_subquery._target = list(self._target)
-
-            # Call user function, which may or may not return a Query
-            # but that doesn't matter as we expect the given query
-            # object to be mutated
-            condition(having_subquery)
-
-            condition = having_subquery._having
-
-        if self._having is None:
-            self._having = condition
-        else:
-            # Set last where clause's boolean
-            self._having = boolean(self._having, condition)
+        self._add_condition("_having", QueryCommands.HAVING, condition, boolean)
 
         return self
 
@@ -649,6 +650,42 @@ class Query:
         """
         return self._options[key]
 
+    def _add_condition(self, section, command, condition, boolean):
+        """
+        Add a condition to one of the boolean sections of the query (where,
+        on or having), combining it with the existing condition, if any.
+
+        Args:
+            section (str): Name of the attribute holding the section
+            command (QueryCommands): Command for the sub-query used to build
+                nested conditions
+            condition (F|callable):
+                - If a F is given, it is used as is.
+                - If a callable is given, it should take a query object as its
+                first positional argument, and it assumes that the user wants to
+                build a nested condition group.
+            boolean (F): Boolean operator between the existing condition and
+                this condition.
+        """
+        if isinstance(condition, FunctionType):
+            sub_query = self._sub_query(command)
+            # Inherit targets
+            sub_query._target = list(self._target)
+
+            # Call user function, which may or may not return a Query
+            # but that doesn't matter as we expect the given query
+            # object to be mutated
+            condition(sub_query)
+
+            condition = getattr(sub_query, section)
+
+        current = getattr(self, section)
+
+        if current is None:
+            setattr(self, section, condition)
+        else:
+            setattr(self, section, boolean(current, condition))
+
     def _sub_query(self, command):
         """
         Return a new Query of a given command, to be used as a subquery.
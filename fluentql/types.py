@@ -26,6 +26,8 @@ from .function import (
 
 
 class Column(WithOperatorSupport, Referenceable):
+    __slots__ = ("name", "_alias", "table")
+
     def __init__(self, name):
         """
         Args:
@@ -168,35 +170,35 @@ class Column(WithOperatorSupport, Referenceable):
 
 
 class AnyColumn(Collection[Any], Column):
-    pass
+    __slots__ = ()
 
 
 class NumberColumn(Collection[NumberType], Column):
-    pass
+    __slots__ = ()
 
 
 class BooleanColumn(Collection[BooleanType], Column):
-    pass
+    __slots__ = ()
 
 
 class StringColumn(Collection[StringType], Column):
-    pass
+    __slots__ = ()
 
 
 class DateColumn(Collection[DateType], Column):
-    pass
+    __slots__ = ()
 
 
 class DateTimeColumn(Collection[DateTimeType], Column):
-    pass
+    __slots__ = ()
 
 
 class TimeColumn(Collection[TimeType], Column):
-    pass
+    __slots__ = ()
 
 
 class Table(Referenceable):
-    __columns__ = None
+    __slots__ = ("name", "db", "__columns__")
 
     def __init__(self, name, db=None):
         """
@@ -206,6 +208,7 @@ class Table(Referenceable):
         """
         self.name = name
         self.db = db
+        self.__columns__ = None
         self._process_annotations()
 
     def column(self, name):
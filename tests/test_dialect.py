@@ -0,0 +1,239 @@
+from datetime import date
+from typing import Any
+
+import pytest
+
+from fluentql import GenericSQLDialect, Q
+from fluentql.dialects.base import BaseDialect
+from fluentql.function import Add, BitwiseAnd, BitwiseOr, F, Max
+from fluentql.types import AnyColumn, Table
+
+
+col1 = AnyColumn("col1")
+test_table = Table("test_table")
+join_table = Table("join_table")
+
+
+class NewFunction(F):
+    a: Any
+    b: Any
+    returns: Any
+
+
+class CustomDialect(GenericSQLDialect):
+    def compile_max_function(self, f):
+        return self.compile_function(f, "greatest")
+
+
+@pytest.fixture
+def dialect():
+    return GenericSQLDialect()
+
+
+@pytest.fixture
+def custom_dialect():
+    return CustomDialect()
+
+
+def test_dispatch_uses_subclass_override(dialect, custom_dialect):
+    # Resolve on the parent first to ensure its dispatch table is not reused
+    assert dialect.dispatch(Max(col1)) == "max(col1)"
+    assert custom_dialect.dispatch(Max(col1)) == "greatest(col1)"
+
+
+def test_dispatch_falls_back_to_generic_function(dialect):
+    assert dialect.dispatch(NewFunction(col1, 10)) == "newfunction(col1, 10)"
+
+
+@pytest.mark.parametrize(
+    ["value", "expected"],
+    [
+        (10, "10"),
+        (1.5, "1.5"),
+        ("abc", "'abc'"),
+        ("it's", "'it''s'"),
+        (True, "true"),
+        (None, "null"),
+    ],
+)
+def test_dispatch_constant(value, expected, dialect):
+    assert dialect.dispatch(value) == expected
+
+
+def test_dispatch_query(dialect):
+    q = Q.select().from_(test_table)
+
+    assert dialect.dispatch(q) == "select * from test_table"
+
+
+def join_query():
+    return (
+        Q.select()
+        .from_(test_table)
+        .inner_join(
+            join_table, lambda q: q.on(test_table["id"] == join_table["id"])
+        )
+        .where(test_table["col1"] == 1)
+    )
+
+
+def test_compile_many(dialect):
+    queries = [
+        Q.select().from_(test_table),
+        join_query(),
+        Q.delete().from_(test_table).where(test_table["col1"] == 1),
+    ]
+
+    assert dialect.compile_many(queries) == [
+        q.compile(GenericSQLDialect) for q in queries
+    ]
+    assert dialect.compile_many(queries) == [
+        "select * from test_table;",
+        "select * from test_table inner join join_table "
+        "on test_table.id = join_table.id where test_table.col1 = 1;",
+        "delete from test_table where col1 = 1;",
+    ]
+
+
+def test_compile_many_keeps_explicit_options():
+    dialect = GenericSQLDialect(use_absolute_names_for_columns=False)
+
+    assert dialect.compile_many([join_query()]) == [
+        "select * from test_table inner join join_table "
+        "on id = id where col1 = 1;"
+    ]
+
+
+class SelectOnlyDialect(BaseDialect):
+    def __init__(self, **options):
+        self.options = options
+
+    def compile_select_query(self, query):
+        return f"select {self.options}"
+
+
+def test_compile_many_with_own_init():
+    queries = [Q.select().from_(test_table), join_query()]
+
+    assert SelectOnlyDialect().compile_many(queries) == [
+        "select {'use_absolute_names_for_columns': False}",
+        "select {'use_absolute_names_for_columns': True}",
+    ]
+
+
+def test_compile_prepared(dialect):
+    q = (
+        Q.select()
+        .from_(test_table)
+        .where(test_table["col1"] == "abc")
+        .where(test_table["col2"] > 10)
+        .fetch(5)
+    )
+
+    assert dialect.compile_prepared(q) == (
+        "select * from test_table where col1 = ? and col2 > ? limit ?;",
+        ["abc", 10, 5],
+    )
+
+    # Constants are inlined again after a prepared compile
+    assert dialect.compile(q) == (
+        "select * from test_table where col1 = 'abc' and col2 > 10 limit 5;"
+    )
+
+
+class DateDialect(GenericSQLDialect):
+    def compile_date_constant(self, val):
+        return f"date '{val.isoformat()}'"
+
+    def compile_str_constant(self, val):
+        return f"n'{val}'"
+
+
+def test_compile_prepared_with_custom_constant_handlers():
+    day = date(2020, 1, 31)
+    q = (
+        Q.select()
+        .from_(test_table)
+        .where(test_table["col1"] == day)
+        .where(test_table["col2"] == "abc")
+    )
+
+    assert DateDialect().compile(q) == (
+        "select * from test_table where col1 = date '2020-01-31' and col2 = n'abc';"
+    )
+    assert DateDialect().compile_prepared(q) == (
+        "select * from test_table where col1 = ? and col2 = ?;",
+        [day, "abc"],
+    )
+
+
+def test_compile_prepared_expands_in_values(dialect):
+    q = Q.select().from_(test_table).where(test_table["col1"].isin([1, 2]))
+
+    assert dialect.compile_prepared(q) == (
+        "select * from test_table where col1 in (?, ?);",
+        [1, 2],
+    )
+
+
+def test_options_do_not_leak_into_defaults():
+    col = test_table["col1"]
+
+    absolute = GenericSQLDialect(use_absolute_names_for_columns=True)
+
+    assert absolute.dispatch(col) == "test_table.col1"
+    assert GenericSQLDialect().dispatch(col) == "col1"
+
+
+class ParenthesisedAddDialect(GenericSQLDialect):
+    def compile_add_function(self, f):
+        return "(" + self.compile_infix_function(f) + ")"
+
+
+def test_infix_chain_goes_through_overridden_handler():
+    f = Add(Add(Add(col1, 1), 2), 3)
+
+    assert ParenthesisedAddDialect().dispatch(f) == "(((col1 add 1) add 2) add 3)"
+    assert GenericSQLDialect().dispatch(f) == "col1 + 1 + 2 + 3"
+
+
+class ParenthesisedInfixDialect(GenericSQLDialect):
+    def compile_infix_function(self, f, name=None):
+        return "(" + super().compile_infix_function(f, name) + ")"
+
+
+def test_infix_chain_goes_through_overridden_infix_function():
+    add = Add(Add(Add(col1, 1), 2), 3)
+    condition = BitwiseOr(BitwiseAnd(col1 == 1, col1 == 2), col1 == 3)
+
+    assert ParenthesisedInfixDialect().dispatch(add) == "(((col1 + 1) + 2) + 3)"
+    assert (
+        ParenthesisedInfixDialect().dispatch(condition)
+        == "(((col1 = 1) and (col1 = 2)) or (col1 = 3))"
+    )
+
+
+def test_query_compile_prepared_with_join():
+    assert join_query().compile_prepared(GenericSQLDialect) == (
+        "select * from test_table inner join join_table "
+        "on test_table.id = join_table.id where test_table.col1 = ?;",
+        [1],
+    )
+
+
+def test_compile_prepared_keeps_using_column():
+    q = Q.select().from_(test_table).left_join(join_table, lambda q: q.using("id"))
+
+    assert q.compile_prepared(GenericSQLDialect) == (
+        "select * from test_table left join join_table using (id);",
+        [],
+    )
+
+
+def test_compile_prepared_does_not_change_dialect(dialect):
+    q = Q.select().from_(test_table).where(test_table["col1"] == 1)
+
+    dialect.compile_prepared(q)
+
+    assert dialect._parameters is None
+    assert dialect.compile(q) == "select * from test_table where col1 = 1;"
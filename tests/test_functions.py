@@ -3,6 +3,7 @@ from typing import Any
 import pytest
 
 from fluentql import GenericSQLDialect, Table
+from fluentql.base_types import BooleanType, Collection, NumberType
 from fluentql.function import (
     F,
     Add,
@@ -84,3 +85,58 @@ def dialect():
 )
 def test_function_compiles_correctly(f, expected, dialect):
     assert dialect.dispatch(f) == expected
+
+
+@pytest.mark.parametrize(
+    ["f", "returns"],
+    [
+        (Equals(col1, 1), Collection[BooleanType]),
+        (Max(col1), Any),
+        (Asc(col1), Collection[Any]),
+        (Star(), Any),
+    ],
+)
+def test_builtin_functions_use_slots(f, returns):
+    assert not hasattr(f, "__dict__")
+    assert f.__returns__ == returns
+
+
+def test_subclass_without_annotations_inherits_signature():
+    class Plus(Add):
+        pass
+
+    assert Plus.__args__ == Add.__args__
+    assert Plus.__declared_returns__ == Add.__declared_returns__
+
+    with pytest.raises(TypeError):
+        Plus(col1)
+
+    # Overriding only returns keeps the parent's arguments
+    class NumberAdd(Add):
+        returns = classmethod(lambda cls, matched_types, mapping: NumberType)
+
+    assert NumberAdd.__args__ == Add.__args__
+    assert NumberAdd(col1, 1).__returns__ is NumberType
+
+    with pytest.raises(TypeError, match="takes 2 arguments, 1 given"):
+        NumberAdd(col1)
+
+
+def test_type_checker_is_shared_for_same_arg_types():
+    assert Add(col1, 1).__type_checker__ is Add(col2, 2).__type_checker__
+
+
+def test_invalid_arg_types_raise_every_time():
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            Like(col1, 1)
+
+
+def test_functions_with_operators_are_hashable():
+    f1 = Add(col1, 1)
+    f2 = Max(col1)
+
+    lookup = {f1: "a", f2: "b"}
+
+    assert lookup[f1] == "a"
+    assert lookup[f2] == "b"
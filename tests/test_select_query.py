@@ -138,6 +138,32 @@ def test_complex_where_query(q, expected, dialect_cls):
     assert q.compile(dialect_cls) == expected
 
 
+def test_long_where_chain(dialect_cls):
+    q = Q.select().from_(test_table)
+
+    for i in range(2000):
+        q = q.where(test_table["col1"] == i)
+
+    compiled = q.compile(dialect_cls)
+
+    assert compiled.startswith("select * from test_table where col1 = 0 and col1 = 1 ")
+    assert compiled.endswith(" and col1 = 1999;")
+
+
+def test_long_mixed_where_chain(dialect_cls):
+    q = Q.select().from_(test_table)
+
+    for i in range(1000):
+        q = q.where(test_table["col1"] == i).or_where(test_table["col2"] == i)
+
+    compiled = q.compile(dialect_cls)
+
+    assert compiled.startswith(
+        "select * from test_table where col1 = 0 or col2 = 0 and col1 = 1 "
+    )
+    assert compiled.endswith(" and col1 = 999 or col2 = 999;")
+
+
 @pytest.mark.parametrize(
     ["q", "expected"],
     [
@@ -202,6 +228,7 @@ def test_group_by_raises_query_builder_error(q, group_by_function):
             .order_by(test_table["col1"], test_table["col2"]),
             "select * from test_table order by col1 asc, col2 asc;",
         ),
+        (Q.select().from_(test_table).order_by(), "select * from test_table;"),
     ],
 )
 def test_order_by(q, expected, dialect_cls):
@@ -273,3 +300,60 @@ def test_distinct(dialect_cls):
     q = Q.select().from_(test_table).distinct()
     expected = "select distinct * from test_table;"
     assert q.compile(dialect_cls) == expected
+
+
+join_table = Table("join_table")
+
+
+@pytest.mark.parametrize(
+    ["q", "expected"],
+    [
+        (
+            Q.select()
+            .from_(test_table)
+            .inner_join(
+                join_table, lambda q: q.on(test_table["id"] == join_table["id"])
+            ),
+            "select * from test_table inner join join_table "
+            "on test_table.id = join_table.id;",
+        ),
+        (
+            Q.select()
+            .from_(test_table)
+            .left_join(
+                join_table,
+                lambda q: q.on(test_table["id"] == join_table["id"]).and_on(
+                    join_table["col1"] > 10
+                ),
+            ),
+            "select * from test_table left join join_table "
+            "on test_table.id = join_table.id and join_table.col1 > 10;",
+        ),
+        (
+            Q.select()
+            .from_(test_table)
+            .right_join(join_table, lambda q: q.using("id")),
+            "select * from test_table right join join_table using (id);",
+        ),
+        (
+            Q.select().from_(test_table).cross_join(join_table),
+            "select * from test_table join join_table;",
+        ),
+    ],
+)
+def test_join(q, expected, dialect_cls):
+    assert q.compile(dialect_cls) == expected
+
+
+def test_join_is_compiled_once(table_a, table_b):
+    compiled_joins = []
+
+    class CountingDialect(GenericSQLDialect):
+        def compile_join_query(self, join):
+            compiled_joins.append(join)
+            return super().compile_join_query(join)
+
+    q = Q.select().from_(table_a).cross_join(table_b)
+    q.compile(CountingDialect)
+
+    assert len(compiled_joins) == 1
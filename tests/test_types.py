@@ -0,0 +1,41 @@
+from typing import Any
+
+import pytest
+
+from fluentql import Q
+from fluentql.base_types import NumberType
+from fluentql.function import Equals
+from fluentql.types import AnyColumn, NumberColumn, Table
+
+
+test_table = Table("test_table")
+
+
+def test_column_is_hashable():
+    col1 = test_table["col1"]
+    col2 = test_table["col2"]
+
+    lookup = {col1: "a", col2: "b"}
+
+    assert lookup[col1] == "a"
+    assert lookup[col2] == "b"
+
+
+def test_column_eq_builds_equals():
+    assert isinstance(AnyColumn("col1") == AnyColumn("col2"), Equals)
+
+
+@pytest.mark.parametrize(
+    "obj", [AnyColumn("col1"), NumberColumn("col1"), test_table, Q.select()]
+)
+def test_objects_use_slots(obj):
+    assert not hasattr(obj, "__dict__")
+
+
+def test_column_dtype():
+    class MyNumberColumn(NumberColumn):
+        pass
+
+    assert NumberColumn.__dtype__ is NumberType
+    assert MyNumberColumn.__dtype__ is NumberType
+    assert AnyColumn.__dtype__ is Any